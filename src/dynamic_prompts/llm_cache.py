@@ -0,0 +1,70 @@
+"""
+On-disk cache for Ollama replies and embeddings, keyed by a SHA-256 of the request.
+
+Re-running prompt generation over the same cases otherwise pays for every
+LLM and embedding round-trip again. Set USE_LLM_CACHE=false to always call the model, and
+LLM_CACHE_PATH to move the cache file (default: ./.llm_cache).
+"""
+
+import atexit
+import dbm
+import hashlib
+import logging
+import os
+import pickle
+import shelve
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+USE_LLM_CACHE = os.getenv("USE_LLM_CACHE", "true").strip().lower() == "true"
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache")
+
+# Corrupt files and files from another dbm backend raise dbm.error, not OSError.
+_CACHE_ERRORS = (OSError, *dbm.error, pickle.UnpicklingError)
+
+_cache = None
+_cache_failed = False
+
+
+def _get_cache():
+    """Open the shelf once per process; reopening per call rewrites dbm.dumb's index each time."""
+    global _cache, _cache_failed
+    if _cache is None and not _cache_failed:
+        try:
+            _cache = shelve.open(CACHE_PATH)
+            atexit.register(_cache.close)
+        except _CACHE_ERRORS:
+            logger.warning("LLM cache at %s is unreadable; ignoring it", CACHE_PATH)
+            _cache_failed = True
+    return _cache
+
+
+def cache_key(model: str, instruction: str, fmt: str = "") -> str:
+    payload = "\0".join((model, fmt, instruction))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached(key: str) -> Optional[Any]:
+    if not USE_LLM_CACHE:
+        return None
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except _CACHE_ERRORS:
+        logger.warning("LLM cache entry %s is unreadable; ignoring it", key)
+        return None
+
+
+def set_cached(key: str, value: Any) -> None:
+    if not USE_LLM_CACHE:
+        return
+    cache = _get_cache()
+    if cache is None:
+        return
+    try:
+        cache[key] = value
+    except _CACHE_ERRORS:
+        logger.warning("Could not write LLM cache at %s", CACHE_PATH)
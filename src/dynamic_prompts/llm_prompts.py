@@ -1,7 +1,10 @@
 import sys
 import json
+import asyncio
 import ollama
 import pandas as pd
+from tqdm import tqdm
+from llm_cache import cache_key, get_cached, set_cached
 
 
 CONTEXT = """"""
@@ -18,6 +21,17 @@ ROLES = {
 
 MODELS = ["llama3:latest", "mistral:latest", "gemma:latest"]
 
+# Requests in flight per model. Ollama serves OLLAMA_NUM_PARALLEL requests at once
+# and queues the rest, so raising this past that setting only adds queueing.
+MAX_CONCURRENT_REQUESTS = 4
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0  # wait = RETRY_BACKOFF * 2^attempt seconds
+_RETRYABLE_STATUS = frozenset({429, 503})
+
+# Roles answered per chat request. Each request repeats the full context, so
+# batching roles cuts both request count and prompt tokens by ~this factor.
+ROLES_PER_CALL = 3
+
 def get_instruction(role, role_desc):
     return f"""Context:
 {CONTEXT}
@@ -32,6 +46,24 @@ Critical Instructions:
 4. Output ONLY the generated prompt. Do not include introductory or concluding text."""
 
 
+def get_batch_instruction(roles):
+    role_lines = "\n".join(f'- "{role}": {ROLES[role]}' for role in roles)
+    return f"""Context:
+{CONTEXT}
+
+Task:
+Using the above context, write one prompt for each role below to ask that role's agent {QUESTION}.
+
+Roles ("name": focus):
+{role_lines}
+
+Critical Instructions:
+1. You are NOT writing responses as these roles.
+2. You are writing the prompts that a user would use to ASK each role's agent.
+3. Each prompt should be tailored to that role's focus.
+4. Output ONLY a JSON object mapping each role name, exactly as written above, to its generated prompt."""
+
+
 def load_cases(json_path: str):
     """
     Accepts either:
@@ -73,54 +105,154 @@ def load_cases(json_path: str):
     return normalized
 
 
-def main():
-    # Usage: python script.py input.json
-    if len(sys.argv) < 2:
-        print("Usage: python script.py <input.json>")
-        sys.exit(1)
+async def generate_one(client, semaphore, model, instruction, json_output=False):
+    """
+    Send one chat request, retrying with exponential backoff while Ollama is busy.
+    Replies are served from the on-disk cache when the same request was made before.
+    """
+    fmt = "json" if json_output else ""
+    key = cache_key(model, instruction, fmt)
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
 
-    input_json = sys.argv[1]
-    cases = load_cases(input_json)
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await client.chat(
+                    model=model,
+                    messages=[{'role': 'user', 'content': instruction}],
+                    format=fmt,
+                )
+                content = response['message']['content'].strip()
+                set_cached(key, content)
+                return content
+            except ollama.ResponseError as e:
+                if e.status_code not in _RETRYABLE_STATUS or attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
 
-    results = []
 
-    print("Starting generation of prompts using local open-source LLMs via Ollama...\n")
-    print(f"Loaded {len(cases)} case(s) from: {input_json}\n")
+async def generate_batch(client, semaphore, model, job):
+    """
+    Generate prompts for all roles in ``job`` with a single JSON request.
+    Roles missing from (or malformed in) the reply are retried one by one.
+    Returns {role: generated prompt}.
+    """
+    raw = await generate_one(client, semaphore, model, job["instruction"], json_output=True)
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        parsed = {}
+    if not isinstance(parsed, dict):
+        parsed = {}
+
+    prompts = {}
+    for role in job["roles"]:
+        value = parsed.get(role)
+        if isinstance(value, str) and value.strip():
+            prompts[role] = value.strip()
 
+    missing = [role for role in job["roles"] if role not in prompts]
+    if missing:
+        singles = await asyncio.gather(*(
+            generate_one(client, semaphore, model, job["single_instructions"][role])
+            for role in missing
+        ), return_exceptions=True)
+        # A failed retry only marks its own role; prompts already parsed are kept.
+        for role, output in zip(missing, singles):
+            if isinstance(output, Exception):
+                print(f"    [Error] Failed to get response from {model} (case {job['case_id']}, {role}). Details: {output}")
+                output = f"ERROR: {output}"
+            prompts[role] = output
+    return prompts
+
+
+async def generate_for_model(client, model, jobs):
+    """
+    Fan out every (case, role batch) job for one model concurrently.
+    Returns one {role: generated prompt} dict per job, in the same order as ``jobs``.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    with tqdm(total=len(jobs), desc=model, unit="req") as pbar:
+        async def tracked(job):
+            try:
+                return await generate_batch(client, semaphore, model, job)
+            finally:
+                pbar.update(1)
+
+        outputs = await asyncio.gather(*(tracked(job) for job in jobs), return_exceptions=True)
+
+    batches = []
+    for job, output in zip(jobs, outputs):
+        if isinstance(output, Exception):
+            print(f"    [Error] Failed to get response from {model} (case {job['case_id']}, {', '.join(job['roles'])}).")
+            print(f"    Make sure Ollama is running and you have pulled the model (`ollama pull {model}`). Details: {output}")
+            output = {role: f"ERROR: {output}" for role in job["roles"]}
+        batches.append(output)
+    return batches
+
+
+async def generate_all(cases):
     global CONTEXT, QUESTION
 
+    # Instructions read the module-level CONTEXT/QUESTION, so build them all up front.
+    role_names = list(ROLES)
+    jobs = []
     for case in cases:
         CONTEXT = case["context"]
         QUESTION = case["question"]
+        for i in range(0, len(role_names), ROLES_PER_CALL):
+            roles = role_names[i : i + ROLES_PER_CALL]
+            jobs.append({
+                "case_id": case["case_id"],
+                "context": CONTEXT,
+                "question": QUESTION,
+                "roles": roles,
+                "instruction": get_batch_instruction(roles),
+                "single_instructions": {role: get_instruction(role, ROLES[role]) for role in roles},
+            })
 
-        print(f"\n==================== Case {case['case_id']} ====================")
-
-        for model in MODELS:
-            print(f"\n========== Loading & Generating with Model: {model} ==========")
-
-            for role, desc in ROLES.items():
-                print(f"  -> Generating for Role: {role}...")
-                instruction = get_instruction(role, desc)
-
-                try:
-                    response = ollama.chat(model=model, messages=[
-                        {'role': 'user', 'content': instruction}
-                    ])
-                    generated_prompt = response['message']['content'].strip()
-                except Exception as e:
-                    print(f"    [Error] Failed to get response from {model}.")
-                    print(f"    Make sure Ollama is running and you have pulled the model (`ollama pull {model}`). Details: {e}")
-                    generated_prompt = f"ERROR: {e}"
+    client = ollama.AsyncClient()
+    results = []
+    # Models run one after another so Ollama keeps a single model loaded at a time.
+    for model in MODELS:
+        print(f"\n========== Loading & Generating with Model: {model} ==========")
+        print(f"  -> Sending {len(jobs)} request(s) ({ROLES_PER_CALL} roles each) with up to {MAX_CONCURRENT_REQUESTS} in flight...")
+        batches = await generate_for_model(client, model, jobs)
 
+        for job, prompts in zip(jobs, batches):
+            for role in job["roles"]:
                 results.append({
-                    "case_id": case["case_id"],
-                    "context": CONTEXT,
-                    "question": QUESTION,
+                    "case_id": job["case_id"],
+                    "context": job["context"],
+                    "question": job["question"],
                     "role": role,
                     "opensourcellm": model,
-                    "generated prompt": generated_prompt
+                    "generated prompt": prompts[role]
                 })
 
+    # Restore the original case -> model -> role row order.
+    model_rank = {m: i for i, m in enumerate(MODELS)}
+    role_rank = {r: i for i, r in enumerate(ROLES)}
+    results.sort(key=lambda r: (r["case_id"], model_rank[r["opensourcellm"]], role_rank[r["role"]]))
+    return results
+
+
+def main():
+    # Usage: python script.py input.json
+    if len(sys.argv) < 2:
+        print("Usage: python script.py <input.json>")
+        sys.exit(1)
+
+    input_json = sys.argv[1]
+    cases = load_cases(input_json)
+
+    print("Starting generation of prompts using local open-source LLMs via Ollama...\n")
+    print(f"Loaded {len(cases)} case(s) from: {input_json}\n")
+
+    results = asyncio.run(generate_all(cases))
+
     # Save to Excel
     output_filename = "generated_prompts.xlsx"
     print(f"\nSaving results to {output_filename}...")
@@ -4,6 +4,7 @@ import ollama
 from config import ROLES, PROMPT_GENERATION_MODEL, DB_CONFIG, TOP_K
 from retriever import build_context, retrieve_similar_chunks
 from db import DBConnection
+from llm_cache import cache_key, get_cached, set_cached
 logger = logging.getLogger(__name__)
 
 def generate_prompt(context: str, question: str, role: str) -> str:
@@ -24,12 +25,19 @@ def generate_prompt(context: str, question: str, role: str) -> str:
                     4. Output ONLY the generated prompt. Do not include introductory or concluding text.
                     """.strip()
 
+    key = cache_key(PROMPT_GENERATION_MODEL, instruction)
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+
     try:
         response = ollama.chat(
             model=PROMPT_GENERATION_MODEL,
             messages=[{"role": "user", "content": instruction}]
         )
-        return response["message"]["content"].strip()
+        content = response["message"]["content"].strip()
+        set_cached(key, content)
+        return content
 
     except Exception as e:
         logging.exception("Failed to generate prompt")
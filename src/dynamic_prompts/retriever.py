@@ -3,22 +3,29 @@ from typing import Optional, List
 from db import DBConnection
 from config import EMBEDDING_MODEL
 import ollama
+from llm_cache import cache_key, get_cached, set_cached
 
 logger = logging.getLogger(__name__)
 
 def get_embedding(text: str) -> List[float]:
+    key = cache_key(EMBEDDING_MODEL, text, fmt="embedding")
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
     try:
         response = ollama.embeddings(
             model=EMBEDDING_MODEL,
             prompt=text
         )
-        return response["embedding"]
+        embedding = response["embedding"]
+        set_cached(key, embedding)
+        return embedding
     except Exception as e:
         logger.exception("Embedding generation failed")
         raise RuntimeError(f"Failed to generate embedding: {e}") from e
 
 def format_vector(vector: list[float]) -> str:
-    return "[" + ",".join(str(x) for x in vector) + "]"
+    return "[" + ",".join(map(str, vector)) + "]"
 
 def retrieve_similar_chunks(
     db: DBConnection,
@@ -29,35 +36,26 @@ def retrieve_similar_chunks(
     query_embedding = get_embedding(question)
     embedding_str = format_vector(query_embedding)
 
+    # One statement for both cases: the filter adds only a WHERE clause, and
+    # ordering by the selected distance sends and parses the vector once.
+    where = "WHERE source = %s" if source_filter else ""
+    sql = f"""
+        SELECT
+            id,
+            source,
+            chunk_index,
+            content,
+            metadata,
+            embedding <=> %s::vector AS distance
+        FROM documents
+        {where}
+        ORDER BY distance
+        LIMIT %s
+    """
     if source_filter:
-        sql = """
-            SELECT
-                id,
-                source,
-                chunk_index,
-                content,
-                metadata,
-                embedding <=> %s::vector AS distance
-            FROM documents
-            WHERE source = %s
-            ORDER BY embedding <=> %s::vector
-            LIMIT %s
-        """
-        params = (embedding_str, source_filter, embedding_str, top_k)
+        params = (embedding_str, source_filter, top_k)
     else:
-        sql = """
-            SELECT
-                id,
-                source,
-                chunk_index,
-                content,
-                metadata,
-                embedding <=> %s::vector AS distance
-            FROM documents
-            ORDER BY embedding <=> %s::vector
-            LIMIT %s
-        """
-        params = (embedding_str, embedding_str, top_k)
+        params = (embedding_str, top_k)
 
     rows = db.fetch_all(sql, params)
     return rows
@@ -4,8 +4,8 @@ import numpy as np
 import psycopg2
 import psycopg2.extras
 from pgvector.psycopg2 import register_vector
-from sentence_transformers import SentenceTransformer
 import torch
+from embedding_models import _load_sentence_transformer
 
 # ====== SET THESE ======
 CHUNKS_DIR = str(Path(__file__).resolve().parents[3] / "out")
@@ -37,7 +37,7 @@ print(f"Loaded {len(records)} chunks from {len(paths)} files")
 # 2) Build embeddings with bge-m3 on GPU
 device = "cuda" if torch.cuda.is_available() else "cpu"
 print("Device:", device)
-model = SentenceTransformer("BAAI/bge-m3", device=device)
+model = _load_sentence_transformer("BAAI/bge-m3", device=device)
 model.max_seq_length = 8192
 texts = [r.get("text", "") for r in records]
 
@@ -68,12 +68,6 @@ with conn.cursor() as cur:
             embedding  VECTOR({dim})
         );
     """)
-    cur.execute(f"""
-        CREATE INDEX IF NOT EXISTS {TABLE}_embedding_hnsw
-        ON {TABLE}
-        USING hnsw (embedding vector_cosine_ops)
-        WITH (m = 16, ef_construction = 64);
-    """)
 conn.commit()
 
 # 4) Upsert in batches
@@ -87,7 +81,7 @@ for r, v in zip(records, emb):
         r.get("topics", []),
         r.get("categories", []),
         bool(r.get("is_tagged", False)),
-        v.tolist(),
+        v,  # register_vector adapts float32 ndarrays directly
     ))
 
 sql = f"""
@@ -104,12 +98,20 @@ ON CONFLICT (chunk_id) DO UPDATE SET
   embedding=EXCLUDED.embedding;
 """
 
-BATCH = 100
+# All batches go into one transaction with a single commit at the end. The
+# HNSW index is built once after the load rather than updated row by row.
+BATCH = 1000
 try:
     with conn.cursor() as cur:
         for i in range(0, len(rows), BATCH):
             psycopg2.extras.execute_batch(cur, sql, rows[i:i+BATCH], page_size=BATCH)
             print(f"Upserted {min(i+BATCH, len(rows))}/{len(rows)}")
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {TABLE}_embedding_hnsw
+            ON {TABLE}
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64);
+        """)
     conn.commit()
 
     with conn.cursor() as cur:
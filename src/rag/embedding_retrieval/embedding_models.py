@@ -1,12 +1,38 @@
 import os
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Optional ONNX Runtime backend for faster CPU inference (needs optimum[onnxruntime]).
+# ST_ONNX_FILE selects a pre-exported variant, e.g. onnx/model_qint8_avx512_vnni.onnx.
+ST_BACKEND = os.getenv("ST_BACKEND", "torch").strip().lower()
+ST_ONNX_FILE = os.getenv("ST_ONNX_FILE", "").strip()
+# Opt-in FP16 for torch SentenceTransformers on a CUDA device (ST_FP16=true).
+# Cosine scores shift by ~1e-3 versus FP32 and near-ties can swap.
+ST_FP16 = os.getenv("ST_FP16", "false").strip().lower() == "true"
+
+
+def _load_sentence_transformer(model_name: str, **kwargs):
+    """Load a SentenceTransformer, using the ONNX backend when ST_BACKEND=onnx."""
+    from sentence_transformers import SentenceTransformer
+    if ST_BACKEND == "onnx":
+        model_kwargs = {"file_name": ST_ONNX_FILE} if ST_ONNX_FILE else None
+        try:
+            return SentenceTransformer(
+                model_name, backend="onnx", model_kwargs=model_kwargs, **kwargs
+            )
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable for {model_name}, using torch: {e}")
+    model = SentenceTransformer(model_name, **kwargs)
+    if ST_FP16 and model.device.type == "cuda":
+        model.half()
+    return model
+
 
 class EmbeddingModel(ABC):
     """Base class for all embedding models."""
@@ -68,15 +94,18 @@ class SentenceTransformerEmbedding(EmbeddingModel):
     """Wrapper around any SentenceTransformer model."""
 
     def __init__(self, model_name: str, display_name: str):
-        from sentence_transformers import SentenceTransformer
         self.name = display_name
-        self._model = SentenceTransformer(model_name)
+        self._model = _load_sentence_transformer(model_name)
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        return self._model.encode(texts, show_progress_bar=True)
+        # FP16 models return float16; search in float32, which numpy can BLAS.
+        return np.asarray(self._model.encode(texts, show_progress_bar=True), dtype=np.float32)
 
     def encode_query(self, query: str) -> np.ndarray:
-        return self._model.encode([query])[0]
+        # Single-text encode: skip the progress bar (shown by default at INFO level).
+        return np.asarray(self._model.encode(
+            [query], batch_size=1, show_progress_bar=False, convert_to_numpy=True
+        )[0], dtype=np.float32)
 
 
 class MiniLMEmbedding(SentenceTransformerEmbedding):
@@ -100,15 +129,18 @@ class BGEM3Embedding(EmbeddingModel):
     name = "BGE-M3"
 
     def __init__(self):
-        from sentence_transformers import SentenceTransformer
-        self._model = SentenceTransformer("BAAI/bge-m3", device="cpu")
+        self._model = _load_sentence_transformer("BAAI/bge-m3", device="cpu")
         self._model.max_seq_length = 8192
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        return self._model.encode(texts, show_progress_bar=True, batch_size=4)
+        return np.asarray(
+            self._model.encode(texts, show_progress_bar=True, batch_size=4), dtype=np.float32
+        )
 
     def encode_query(self, query: str) -> np.ndarray:
-        return self._model.encode([query], device="cpu")[0]
+        return np.asarray(self._model.encode(
+            [query], device="cpu", batch_size=1, show_progress_bar=False, convert_to_numpy=True
+        )[0], dtype=np.float32)
 
 
 class InstructorXLEmbedding(EmbeddingModel):
@@ -132,7 +164,9 @@ class InstructorXLEmbedding(EmbeddingModel):
         return self._model.encode(pairs, batch_size=16, show_progress_bar=True)
 
     def encode_query(self, query: str) -> np.ndarray:
-        return self._model.encode([[self.QUERY_INSTRUCTION, query]])[0]
+        return self._model.encode(
+            [[self.QUERY_INSTRUCTION, query]], batch_size=1, show_progress_bar=False
+        )[0]
 
 
 class OllamaEmbedding(EmbeddingModel):
@@ -143,27 +177,33 @@ class OllamaEmbedding(EmbeddingModel):
         self._base_url = (base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")).rstrip("/")
         self.name = f"Ollama-{model_name}"
         self._max_chars = int(os.getenv("OLLAMA_EMBED_MAX_CHARS", "12000"))
+        # Per-text requests in flight when /api/embed is unavailable.
+        self._concurrency = max(1, int(os.getenv("OLLAMA_EMBED_CONCURRENCY", "4")))
+        self._session = None
 
-    def _embed_one(self, text: str):
-        import requests
+    def _get_session(self):
+        """One keep-alive session per model, so batches reuse the same connection."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
 
+    def _embed_one(self, text: str):
         # Remove problematic null bytes and normalise whitespace.
         clean = text.replace("\x00", " ").strip()
         if not clean:
             clean = " "
 
-        lengths = [
-            None,
-            self._max_chars,
-            max(8000, self._max_chars // 2),
-            4000,
-            2000,
-            1000,
-        ]
+        # Retry with progressively shorter prompts. Limits that would not cut
+        # the text resend the same prompt, so only keep strictly shorter ones.
+        prompts = [clean]
+        for max_len in (self._max_chars, max(8000, self._max_chars // 2), 4000, 2000, 1000):
+            if max_len < len(prompts[-1]):
+                prompts.append(clean[:max_len])
+
         last_error = None
-        for max_len in lengths:
-            prompt = clean if max_len is None else clean[:max_len]
-            resp = requests.post(
+        for prompt in prompts:
+            resp = self._get_session().post(
                 f"{self._base_url}/api/embeddings",
                 json={"model": self._model_name, "prompt": prompt},
                 timeout=120,
@@ -178,11 +218,9 @@ class OllamaEmbedding(EmbeddingModel):
         )
 
     def _embed_batch(self, texts: List[str]) -> np.ndarray:
-        import requests
-
         # Prefer batch endpoint when available.
         try:
-            resp = requests.post(
+            resp = self._get_session().post(
                 f"{self._base_url}/api/embed",
                 json={"model": self._model_name, "input": texts},
                 timeout=120,
@@ -195,10 +233,13 @@ class OllamaEmbedding(EmbeddingModel):
         except Exception:
             pass
 
-        # Fallback to per-text endpoint for compatibility.
-        vectors = []
-        for text in texts:
-            vectors.append(self._embed_one(text))
+        # Fallback to per-text endpoint for compatibility; the calls are
+        # network-bound, so keep several in flight (map() preserves order).
+        if self._concurrency == 1 or len(texts) <= 1:
+            vectors = [self._embed_one(text) for text in texts]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._concurrency, len(texts))) as pool:
+                vectors = list(pool.map(self._embed_one, texts))
         return np.asarray(vectors, dtype=np.float32)
 
     def encode(self, texts: List[str]) -> np.ndarray:
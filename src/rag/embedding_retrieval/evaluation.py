@@ -87,6 +87,23 @@ def load_chunks_from_chunker_output(chunker_output_dir: str):
     return chunks
 
 
+def _intern_labels(record: Dict) -> Dict:
+    """
+    Intern the small, heavily repeated label strings of a chunk record.
+
+    json.loads gives every record its own copies of the same few topic,
+    category and source names; interning keeps one object per label, which
+    saves memory and lets equality checks succeed on identity.
+    """
+    for key in ("topics", "categories"):
+        labels = record.get(key)
+        if isinstance(labels, list):
+            record[key] = [sys.intern(label) if isinstance(label, str) else label for label in labels]
+    if isinstance(record.get("source"), str):
+        record["source"] = sys.intern(record["source"])
+    return record
+
+
 def _load_chunks_jsonl(jsonl_path: str) -> List[Dict]:
     """Load full chunk records from a JSONL file (preserves all metadata)."""
     records = []
@@ -96,10 +113,11 @@ def _load_chunks_jsonl(jsonl_path: str) -> List[Dict]:
             if not line:
                 continue
             try:
-                records.append(json.loads(line))
+                record = json.loads(line)
             except json.JSONDecodeError:
                 import ast
-                records.append(ast.literal_eval(line))
+                record = ast.literal_eval(line)
+            records.append(_intern_labels(record) if isinstance(record, dict) else record)
     return records
 
 
@@ -146,9 +164,13 @@ def evaluate_with_pinecone(chunks: List[Dict], ground_truth: List[Dict]) -> None
     model = MPNetEmbedding()
     store = build_store_from_env(model, index_name="bridge-rag")
 
-    # Build chunk_id → index map so Pinecone results can be scored
-    chunk_id_to_idx = {r["chunk_id"]: i for i, r in enumerate(chunks)}
-    chunk_texts = [r["text"] for r in chunks]
+    # Build chunk_id → index map so Pinecone results can be scored, collecting
+    # the texts in the same pass over the records
+    chunk_id_to_idx = {}
+    chunk_texts = []
+    for i, r in enumerate(chunks):
+        chunk_id_to_idx[r["chunk_id"]] = i
+        chunk_texts.append(r["text"])
 
     print(f"\n  Upserting {len(chunks)} chunks to Pinecone (skipped if already present)...")
     store.upsert_chunks(chunks)
@@ -167,9 +189,8 @@ def evaluate_with_pinecone(chunks: List[Dict], ground_truth: List[Dict]) -> None
 
         results = store.query(query, k=PRODUCTION_K)
         retrieved_indices = [
-            chunk_id_to_idx[r["chunk_id"]]
-            for r in results
-            if r["chunk_id"] in chunk_id_to_idx
+            idx for idx in (chunk_id_to_idx.get(r["chunk_id"]) for r in results)
+            if idx is not None
         ]
 
         relevant_set = set(relevant_indices)
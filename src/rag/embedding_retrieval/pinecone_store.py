@@ -34,6 +34,19 @@ def _ascii_id(chunk_id: str) -> str:
     normalised = unicodedata.normalize("NFKD", chunk_id)
     return normalised.encode("ascii", "ignore").decode("ascii")
 
+def _encode_unique(model: EmbeddingModel, texts: List[str]) -> np.ndarray:
+    """Encode each distinct text once and scatter the embeddings back to input order.
+
+    Overlapping chunkers and pages shared across sources produce byte-identical
+    chunks; there is no point running the model on them more than once.
+    """
+    first_index: Dict[str, int] = {}
+    inverse = [first_index.setdefault(t, len(first_index)) for t in texts]
+    if len(first_index) < len(texts):
+        logger.info(f"Skipping {len(texts) - len(first_index)} duplicate chunk texts.")
+    embeddings = np.asarray(model.encode(list(first_index)))
+    return embeddings[inverse]
+
 class PineconeVectorStore:
     """
     Wraps a Pinecone index for BRIDGE chunk storage and retrieval.
@@ -104,17 +117,16 @@ class PineconeVectorStore:
         """
         texts = [r["text"] for r in chunk_records]
         logger.info(f"Encoding {len(texts)} chunks with {self._model.name}...")
-        embeddings = self._model.encode(texts)
+        embeddings = np.ascontiguousarray(_encode_unique(self._model, texts), dtype=np.float32)
 
-        # Normalise to unit vectors for cosine similarity
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10
-        embeddings = embeddings / norms
+        # Normalise to unit vectors for cosine similarity (in place, float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10
 
         vectors = []
-        for record, emb in zip(chunk_records, embeddings):
+        for record, values in zip(chunk_records, embeddings.tolist()):
             vectors.append({
                 "id": _ascii_id(record["chunk_id"]),
-                "values": emb.tolist(),
+                "values": values,
                 "metadata": {
                     "text":       record.get("text", ""),
                     "doc_id":     record.get("doc_id", ""),
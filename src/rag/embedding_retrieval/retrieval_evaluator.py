@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections import defaultdict
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -13,9 +14,21 @@ logger = logging.getLogger(__name__)
 
 def is_chunk_relevant(chunk_text: str, keywords: List[str], min_matches: int) -> bool:
     """Check if a chunk is relevant based on keyword matching."""
-    text_lower = chunk_text.lower()
-    matches = sum(1 for kw in keywords if kw.lower() in text_lower)
-    return matches >= min_matches
+    return _has_min_matches(chunk_text.lower(), [kw.lower() for kw in keywords], min_matches)
+
+
+def _has_min_matches(text_lower: str, keywords_lower: List[str], min_matches: int) -> bool:
+    """is_chunk_relevant on text and keywords that are already lowercased."""
+    if min_matches <= 0:
+        return True
+    matches = 0
+    for kw in keywords_lower:
+        if kw in text_lower:
+            matches += 1
+            # Stop scanning as soon as the chunk qualifies
+            if matches >= min_matches:
+                return True
+    return False
 
 
 class RetrievalEvaluator:
@@ -31,6 +44,23 @@ class RetrievalEvaluator:
         self.chunks = [r["text"] if isinstance(r, dict) else r for r in chunk_records]
         self.k_values = k_values
         self._corpus_cache: Dict = {}
+        # Relevance labels depend only on the query's keywords, yet every model
+        # and evaluation mode asks for them again; lowercase the corpus once and
+        # memoise the labels per (keywords, min_matches).
+        self._chunks_lower = [c.lower() for c in self.chunks]
+        self._relevant_cache: Dict[Tuple[Tuple[str, ...], int], List[int]] = {}
+
+        # topic / category -> chunk indices, built in one pass so the filtered
+        # evaluations look indices up instead of rescanning every record.
+        self._topic_index: Dict[str, List[int]] = defaultdict(list)
+        self._category_index: Dict[str, List[int]] = defaultdict(list)
+        for i, r in enumerate(chunk_records):
+            if not isinstance(r, dict):
+                continue
+            for topic in dict.fromkeys(r.get("topics", [])):
+                self._topic_index[topic].append(i)
+            for category in dict.fromkeys(r.get("categories", [])):
+                self._category_index[category].append(i)
 
     def _get_corpus_embeddings(self, model: "EmbeddingModel"):
         """Encode corpus once per model and reuse across all evaluate_* calls."""
@@ -43,27 +73,26 @@ class RetrievalEvaluator:
         """Return indices of all chunks relevant to a ground-truth query."""
         keywords = query_gt["relevant_keywords"]
         min_matches = query_gt.get("min_keyword_matches", 2)
-        return [
-            i for i, chunk in enumerate(self.chunks)
-            if is_chunk_relevant(chunk, keywords, min_matches)
-        ]
+        key = (tuple(keywords), min_matches)
+        relevant = self._relevant_cache.get(key)
+        if relevant is None:
+            keywords_lower = [kw.lower() for kw in keywords]
+            relevant = [
+                i for i, text in enumerate(self._chunks_lower)
+                if _has_min_matches(text, keywords_lower, min_matches)
+            ]
+            self._relevant_cache[key] = relevant
+        return list(relevant)
 
     def _get_filtered_indices(self, topic: str) -> List[int]:
         """Return indices of chunks tagged with the given topic."""
-        return [
-            i for i, r in enumerate(self.chunk_records)
-            if isinstance(r, dict) and topic in r.get("topics", [])
-        ]
+        return list(self._topic_index.get(topic, ()))
 
     def _get_profession_filtered_indices(self, profession: str) -> List[int]:
         """Return indices of chunks whose categories include the given profession or 'General'."""
-        return [
-            i for i, r in enumerate(self.chunk_records)
-            if isinstance(r, dict) and (
-                profession in r.get("categories", [])
-                or "General" in r.get("categories", [])
-            )
-        ]
+        matched = set(self._category_index.get(profession, ()))
+        matched.update(self._category_index.get("General", ()))
+        return sorted(matched)
 
     def evaluate_single_query(
         self,
@@ -1,17 +1,22 @@
 from __future__ import annotations
-import re
-from typing import List
+from typing import TYPE_CHECKING, List
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import nltk
 from nltk.tokenize import sent_tokenize
 from dataclass import Chunk
 from utils import detect_heading, split_paragraphs, estimate_tokens, _cos_sim
 
+if TYPE_CHECKING:
+    # Annotation only; importing sentence_transformers loads torch, which the
+    # web chunker and the non-semantic chunkers never need.
+    from sentence_transformers import SentenceTransformer
+
 DEFAULT_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
 def chunk_fixed(text: str, doc_id: str, target_tokens: int = 7000) -> List[Chunk]:
-    words = re.findall(r"\S+", text)
+    # split() yields the same tokens as \S+; joined words have no outer
+    # whitespace, so the chunk text needs no further strip.
+    words = text.split()
     if not words:
         return []
     target_words = max(50, int(target_tokens * 0.75))
@@ -19,14 +24,14 @@ def chunk_fixed(text: str, doc_id: str, target_tokens: int = 7000) -> List[Chunk
     start, cid = 0, 0
     while start < len(words):
         end = min(len(words), start + target_words)
-        chunk_text = " ".join(words[start:end]).strip()
+        chunk_text = " ".join(words[start:end])
         chunks.append(Chunk("fixed", doc_id, f"{doc_id}::fixed::{cid}", chunk_text))
         cid += 1
         start = end
     return chunks
 
 def chunk_fixed_overlap(text: str, doc_id: str, target_tokens: int = 7000, overlap_tokens: int = 120) -> List[Chunk]:
-    words = re.findall(r"\S+", text)
+    words = text.split()
     if not words:
         return []
     target_words = max(50, int(target_tokens * 0.75))
@@ -37,7 +42,7 @@ def chunk_fixed_overlap(text: str, doc_id: str, target_tokens: int = 7000, overl
     start, cid = 0, 0
     while start < len(words):
         end = min(len(words), start + target_words)
-        chunk_text = " ".join(words[start:end]).strip()
+        chunk_text = " ".join(words[start:end])
         chunks.append(Chunk("fixed_overlap", doc_id, f"{doc_id}::fixed_overlap::{cid}", chunk_text))
         cid += 1
         if end == len(words):
@@ -129,7 +134,8 @@ def chunk_sentence_pack(text: str, doc_id: str, target_tokens: int = 7000) -> Li
     def flush():
         nonlocal cid, current, cur_tokens
         if current:
-            chunk_text = " ".join(current).strip()
+            # members were stripped and empty ones skipped on append
+            chunk_text = " ".join(current)
             if chunk_text:
                 chunks.append(Chunk("sentence_pack", doc_id, f"{doc_id}::sentence_pack::{cid}", chunk_text))
                 cid += 1
@@ -181,11 +187,14 @@ def chunk_semantic(
     cur_sents: List[str] = []
     cur_embs: List[np.ndarray] = []
     cur_tokens = 0
+    # Running sum of cur_embs, so the centroid is O(dim) per sentence instead of
+    # re-stacking the whole chunk; the centroid is therefore float64, not float32.
+    cur_sum = np.zeros((sent_embs.shape[1],), dtype=np.float64)
 
-    def centroid(embs: List[np.ndarray]) -> np.ndarray:
-        if not embs:
+    def centroid() -> np.ndarray:
+        if not cur_embs:
             return np.zeros((sent_embs.shape[1],), dtype=np.float32)
-        return np.mean(np.stack(embs, axis=0), axis=0)
+        return cur_sum / len(cur_embs)
 
     def last_window_avg(embs: List[np.ndarray], w: int) -> np.ndarray:
         if not embs:
@@ -196,11 +205,13 @@ def chunk_semantic(
     def flush():
         nonlocal cid, cur_sents, cur_embs, cur_tokens
         if cur_sents:
-            chunk_text = " ".join(cur_sents).strip()
+            # members were stripped and empty ones skipped on append
+            chunk_text = " ".join(cur_sents)
             if chunk_text:
                 chunks.append(Chunk("semantic", doc_id, f"{doc_id}::semantic::{cid}", chunk_text))
                 cid += 1
         cur_sents, cur_embs, cur_tokens = [], [], 0
+        cur_sum[:] = 0.0
 
     for s, e in zip(sents, sent_embs):
         stoks = estimate_tokens(s)
@@ -219,10 +230,11 @@ def chunk_semantic(
         if not cur_sents:
             cur_sents.append(s)
             cur_embs.append(e)
+            cur_sum += e
             cur_tokens += stoks
             continue
 
-        cen = centroid(cur_embs)
+        cen = centroid()
         lw = last_window_avg(cur_embs, window)
         sim_to_cen = _cos_sim(e, cen)
         sim_to_lw = _cos_sim(e, lw)
@@ -233,12 +245,14 @@ def chunk_semantic(
             flush()
             cur_sents.append(s)
             cur_embs.append(e)
+            cur_sum += e
             cur_tokens += stoks
         else:
             cur_sents.append(s)
             cur_embs.append(e)
+            cur_sum += e
             cur_tokens += stoks
 
     flush()
-    chunks = [c for c in chunks if estimate_tokens(c.text) >= 30]
+    chunks = [c for c in chunks if c.token_count >= 30]
     return chunks
\ No newline at end of file
@@ -1,8 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+from utils import estimate_tokens
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     method: str
     doc_id: str
     chunk_id: str
     text: str
+    _tokens: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def token_count(self) -> int:
+        """estimate_tokens(self.text), computed on first use and reused by later filters/records."""
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.text)
+        return self._tokens
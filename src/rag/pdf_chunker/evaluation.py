@@ -5,7 +5,7 @@ import pandas as pd
 from sentence_transformers import SentenceTransformer
 import nltk
 from nltk.tokenize import sent_tokenize
-from utils import estimate_tokens, normalize_text, embed_texts
+from utils import normalize_text, embed_texts, tag_chunk
 from dataclass import Chunk
 from chunkers import chunk_fixed, chunk_fixed_overlap, chunk_recursive, chunk_sentence_pack, chunk_semantic
 from vectorindex import VectorIndex
@@ -118,67 +118,6 @@ def keyword_threshold_hit(chunk_text: str, qspec: Dict[str, Any]) -> Tuple[bool,
 
 
 
-# ----------------------------
-# Opioid topic tagging
-# ----------------------------
-
-OPIOID_TOPICS: Dict[str, List[str]] = {
-    "overdose": [
-        "overdose", "unresponsive", "unconscious", "blue lips", "cyanosis",
-        "stopped breathing", "not breathing", "limp", "won't wake",
-    ],
-    "emergency": [
-        "call 911", "emergency", "immediate action", "acute", "life-threatening",
-        "emergency room", "er visit", "urgent care",
-    ],
-    "naloxone": [
-        "naloxone", "narcan", "intranasal", "nasal spray", "intramuscular",
-        "opioid reversal", "antagonist",
-    ],
-    "withdrawal": [
-        "withdrawal", "detox", "detoxification", "cravings", "taper", "tapering",
-        "physical dependence", "abstinence", "discontinuation",
-    ],
-    "dosage": [
-        "dosage", "dose", "mg", "milligram", "prescribe", "titrate", "titration",
-        "twice daily", "once daily", "frequency",
-    ],
-    "treatment": [
-        "buprenorphine", "methadone", "suboxone", "mat", "medication assisted",
-        "treatment program", "opioid use disorder", "oud", "subutex",
-    ],
-    "prevention": [
-        "harm reduction", "prevention", "safe use", "risk reduction",
-        "safe storage", "disposal", "lock box", "take back",
-    ],
-    "mental_health": [
-        "mental health", "depression", "anxiety", "ptsd", "co-occurring",
-        "dual diagnosis", "counseling", "therapy", "psychiatric",
-    ],
-    "legal": [
-        "law", "legal", "regulation", "prescription", "controlled substance",
-        "dea", "schedule", "patient rights", "privacy", "hipaa",
-    ],
-    "patient_education": [
-        "patient education", "inform patient", "tell patient", "family",
-        "caregiver", "warning signs", "side effects", "what to expect",
-    ],
-}
-
-
-def tag_chunk(text: str) -> Dict[str, Any]:
-    """
-    Tag a chunk with opioid-domain topics using multi-label keyword matching.
-    Chunks that match no topic are NOT dropped — they get topics=[] and is_tagged=False.
-    """
-    text_lower = text.lower()
-    matched = [
-        topic for topic, keywords in OPIOID_TOPICS.items()
-        if any(kw in text_lower for kw in keywords)
-    ]
-    return {"topics": matched, "is_tagged": len(matched) > 0}
-
-
 # ----------------------------
 # Build chunks per method
 # ----------------------------
@@ -220,7 +159,7 @@ def build_chunks_for_method(
             raise ValueError(f"Unknown method: {method}")
 
         # Filter super tiny fragments per file
-        file_chunks = [c for c in file_chunks if estimate_tokens(c.text) >= 30]
+        file_chunks = [c for c in file_chunks if c.token_count >= 30]
         chunks_by_file[doc_id] = file_chunks
         all_chunks.extend(file_chunks)
 
@@ -300,7 +239,7 @@ def save_chunked_data(
                     "source": "pdf",
                     "categories": categories,
                     "text": chunk.text,
-                    "token_count": estimate_tokens(chunk.text),
+                    "token_count": chunk.token_count,
                     "topics": tags["topics"],
                     "is_tagged": tags["is_tagged"],
                 }
@@ -349,12 +288,13 @@ def run_experiment(
     # Run queries + score Hit@k
     all_rows: List[Dict[str, Any]] = []
 
-    for q in questions:
+    # Encode every question in one batched call rather than one call per question
+    q_embs = embed_texts(model, [q["query"] for q in questions])
+
+    for q, q_emb in zip(questions, q_embs):
         qid = q["id"]
         qtext = q["query"]
 
-        q_emb = embed_texts(model, [qtext], batch_size=1)[0]
-
         rows = []
         for m in methods:
             results = indexes[m].search(q_emb, top_k=k)
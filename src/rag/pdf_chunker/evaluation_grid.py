@@ -7,7 +7,7 @@ from sentence_transformers import SentenceTransformer
 import nltk
 from nltk.tokenize import sent_tokenize
 
-from utils import estimate_tokens, normalize_text, embed_texts
+from utils import normalize_text, embed_texts
 from dataclass import Chunk
 from chunkers import (
     chunk_fixed,
@@ -125,7 +125,7 @@ def build_chunks_for_method(
         else:
             raise ValueError(f"Unknown method: {method}")
 
-    return [c for c in all_chunks if estimate_tokens(c.text) >= 30]
+    return [c for c in all_chunks if c.token_count >= 30]
 
 
 
@@ -161,7 +161,7 @@ def build_indexes(
         idx.add(embs, chunks)
         build_index_time = time.time() - t1
 
-        tok_lens = [estimate_tokens(c.text) for c in chunks] if chunks else [0]
+        tok_lens = [c.token_count for c in chunks] if chunks else [0]
         meta[m] = {
             "num_chunks": len(chunks),
             "chunk_build_time_s": build_chunks_time,
@@ -192,6 +192,9 @@ def run_grid_experiment(
 
     all_rows: List[Dict[str, Any]] = []
 
+    # Questions do not depend on the chunking, so encode them once for the whole grid
+    q_embs = embed_texts(model, [q["query"] for q in questions])
+
     for target_tokens in target_tokens_list:
         indexes, meta = build_indexes(methods, corpus, target_tokens=target_tokens, model=model)
 
@@ -200,10 +203,9 @@ def run_grid_experiment(
 
             stats = {m: {"hits": 0, "first_ranks": [], "lat_ms": []} for m in methods}
 
-            for q in questions:
+            for q, q_emb in zip(questions, q_embs):
                 qid = q["id"]
                 qtext = q["query"]
-                q_emb = embed_texts(model, [qtext], batch_size=1)[0]
 
                 for m in methods:
                     t0 = time.time()
@@ -1,21 +1,33 @@
+from __future__ import annotations
 import re, math
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# Compiled once: detect_heading runs per line and split_paragraphs per block.
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\n(\w)")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_NUMBERED_HEADING_RE = re.compile(r"\d+(\.\d+)*\s+\S+")
 
 def estimate_tokens(text: str) -> int:
-    words = re.findall(r"\S+", text)
-    return int(math.ceil(len(words) / 0.75)) if words else 0
+    # str.split() with no separator splits on the same whitespace as \S+ but
+    # skips the regex engine; this runs for every candidate chunk.
+    n_words = len(text.split())
+    return int(math.ceil(n_words / 0.75)) if n_words else 0
 
 def normalize_text(raw: str) -> str:
     t = raw.replace("\r\n", "\n").replace("\r", "\n")
-    t = re.sub(r"(\w)-\n(\w)", r"\1\2", t)  
-    t = re.sub(r"\n{3,}", "\n\n", t)    
+    t = _HYPHEN_BREAK_RE.sub(r"\1\2", t)
+    t = _BLANK_RUN_RE.sub("\n\n", t)
     t = "\n".join(line.rstrip() for line in t.splitlines())
     return t.strip()
 
 def split_paragraphs(text: str) -> List[str]:
-    return [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    stripped = (p.strip() for p in _PARA_SPLIT_RE.split(text))
+    return [p for p in stripped if p]
 
 def detect_heading(line: str) -> bool:
     s = line.strip()
@@ -23,7 +35,7 @@ def detect_heading(line: str) -> bool:
         return False
     if s.startswith("#"):
         return True
-    if re.match(r"^\d+(\.\d+)*\s+\S+", s):
+    if _NUMBERED_HEADING_RE.match(s):
         return True
     if s.isupper() and 4 <= len(s) <= 80:
         return True
@@ -36,4 +48,60 @@ def _cos_sim(a: np.ndarray, b: np.ndarray) -> float:
 
 def embed_texts(model: SentenceTransformer, texts: List[str], batch_size: int = 64) -> np.ndarray:
     emb = model.encode(texts, batch_size=batch_size, show_progress_bar=True, normalize_embeddings=False)
-    return np.asarray(emb, dtype=np.float32)
\ No newline at end of file
+    return np.asarray(emb, dtype=np.float32)
+
+# Opioid topic tagging, shared by the PDF and web chunker evaluations.
+OPIOID_TOPICS: Dict[str, Tuple[str, ...]] = {
+    "overdose": (
+        "overdose", "unresponsive", "unconscious", "blue lips", "cyanosis",
+        "stopped breathing", "not breathing", "limp", "won't wake",
+    ),
+    "emergency": (
+        "call 911", "emergency", "immediate action", "acute", "life-threatening",
+        "emergency room", "er visit", "urgent care",
+    ),
+    "naloxone": (
+        "naloxone", "narcan", "intranasal", "nasal spray", "intramuscular",
+        "opioid reversal", "antagonist",
+    ),
+    "withdrawal": (
+        "withdrawal", "detox", "detoxification", "cravings", "taper", "tapering",
+        "physical dependence", "abstinence", "discontinuation",
+    ),
+    "dosage": (
+        "dosage", "dose", "mg", "milligram", "prescribe", "titrate", "titration",
+        "twice daily", "once daily", "frequency",
+    ),
+    "treatment": (
+        "buprenorphine", "methadone", "suboxone", "mat", "medication assisted",
+        "treatment program", "opioid use disorder", "oud", "subutex",
+    ),
+    "prevention": (
+        "harm reduction", "prevention", "safe use", "risk reduction",
+        "safe storage", "disposal", "lock box", "take back",
+    ),
+    "mental_health": (
+        "mental health", "depression", "anxiety", "ptsd", "co-occurring",
+        "dual diagnosis", "counseling", "therapy", "psychiatric",
+    ),
+    "legal": (
+        "law", "legal", "regulation", "prescription", "controlled substance",
+        "dea", "schedule", "patient rights", "privacy", "hipaa",
+    ),
+    "patient_education": (
+        "patient education", "inform patient", "tell patient", "family",
+        "caregiver", "warning signs", "side effects", "what to expect",
+    ),
+}
+
+def tag_chunk(text: str) -> Dict[str, Any]:
+    """
+    Tag a chunk with opioid-domain topics using multi-label keyword matching.
+    Chunks that match no topic are NOT dropped — they get topics=[] and is_tagged=False.
+    """
+    text_lower = text.lower()
+    matched = [
+        topic for topic, keywords in OPIOID_TOPICS.items()
+        if any(kw in text_lower for kw in keywords)
+    ]
+    return {"topics": matched, "is_tagged": len(matched) > 0}
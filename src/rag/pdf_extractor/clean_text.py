@@ -2,6 +2,7 @@
 import glob
 import os
 import re
+from collections import Counter
 
 INPUT_DIR = os.path.join(os.path.dirname(__file__), "outputs")
 
@@ -17,12 +18,15 @@ def remove_page_markers(text: str) -> str:
 
 def remove_running_headers_footers(text: str) -> str:
     """Remove lines that repeat 5+ times — running headers/footers from PDF pagination."""
-    from collections import Counter
     lines = text.splitlines()
-    counts = Counter(l.strip() for l in lines if l.strip())
+    stripped = [l.strip() for l in lines]
+    counts = Counter(stripped)
+    counts.pop("", None)
     # Only remove short-to-medium repeated lines (headers/footers, not section content)
     noise = {line for line, count in counts.items() if count >= 20 and len(line) <= 20}
-    cleaned = [l for l in lines if l.strip() not in noise]
+    if not noise:
+        return "\n".join(lines)
+    cleaned = [l for l, s in zip(lines, stripped) if s not in noise]
     return "\n".join(cleaned)
 
 
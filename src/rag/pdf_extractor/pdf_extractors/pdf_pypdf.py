@@ -1,17 +1,40 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
 
+# Below this many pages, worker start-up costs more than the parallelism saves.
+_MIN_PAGES_FOR_POOL = 16
+
+
+def _extract_page_range(args):
+    """Worker: re-open the PDF and extract text for pages [start, stop)."""
+    filepath, start, stop = args
+    reader = PdfReader(filepath)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
 
 class PDFPyPDF:
-    def __init__(self):
-        pass
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
 
     def pdf_extract(self, filepath):
         reader = PdfReader(filepath)
-        all_text = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                all_text.append(text)
+        num_pages = len(reader.pages)
+
+        if self.workers <= 1 or num_pages < _MIN_PAGES_FOR_POOL:
+            texts = [page.extract_text() for page in reader.pages]
+        else:
+            # pypdf text extraction is pure-Python CPU work, so split the pages
+            # into one contiguous range per process and keep page order.
+            step = -(-num_pages // self.workers)
+            ranges = [
+                (filepath, start, min(start + step, num_pages))
+                for start in range(0, num_pages, step)
+            ]
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                texts = [text for part in pool.map(_extract_page_range, ranges) for text in part]
+
+        all_text = [text for text in texts if text]
 
         final_text = "\n".join(all_text)
         return final_text
@@ -41,29 +41,44 @@ class PDFtoXMLextractor:
             ]
         }
         """
-        # root = ET.parse(xml_path).getroot()
-        root = ET.fromstring(xmloutput)
+        # Stream the (glyph-level, very large) XML and drop each <page> once read.
+        if isinstance(xmloutput, (bytes, bytearray)):
+            source = io.BytesIO(xmloutput)
+        else:
+            source = io.StringIO(xmloutput)
         out_pages: List[Dict[str, Any]] = []
 
-        for page in root.findall("./page"): 
+        root = None
+        depth = 0
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            # Only top-level <page> elements, as root.findall("./page") did
+            if depth != 1 or elem.tag != "page":
+                continue
+
+            page = elem
             page_id = page.get("id")
             page_bbox = page.get("bbox")
 
             tb_map: Dict[str, Dict[str, Any]] = {}
 
-            for tb in page.findall("./textbox"):
+            for tb in page.iterfind("textbox"):
                 tb_id = tb.get("id")
                 tb_bbox = tb.get("bbox")
 
                 lines: List[str] = []
 
-                for tl in tb.findall("./textline"):
-                    parts = [(t.text or "") for t in tl.findall("./text")]
-
-                    line = "".join(parts)
+                for tl in tb.iterfind("textline"):
+                    # One <text> per glyph; split() collapses the same characters as \s+.
+                    line = "".join([t.text or "" for t in tl.iterfind("text")])
 
                     if collapse_spaces:
-                        line = re.sub(r"\s+", " ", line).strip()
+                        line = " ".join(line.split())
                     else:
                         line = line.strip()
 
@@ -83,6 +98,7 @@ class PDFtoXMLextractor:
                 "page_bbox": page_bbox,
                 "textboxes": tb_map
             })
+            root.remove(page)
 
         return {"pages": out_pages}
     
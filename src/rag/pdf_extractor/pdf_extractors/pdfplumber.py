@@ -130,8 +130,9 @@ class PDFPlumberExtractor:
                 page_text, tables = self.extract_text_without_table_duplicates(page, table_settings)
 
                 chunks.append(f"\n\n=== Page {i} ===\n")
-                if page_text.strip():
-                    chunks.append(page_text.strip())
+                page_text = page_text.strip()
+                if page_text:
+                    chunks.append(page_text)
 
                 for ti, tbl in enumerate(tables, start=1):
                     md = self._table_to_markdown(tbl)
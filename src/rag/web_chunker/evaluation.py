@@ -13,6 +13,8 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any, Dict, List, Tuple
 
 _PDF_CHUNKER_DIR = os.path.join(os.path.dirname(__file__), "..", "pdf_chunker")
@@ -22,7 +24,7 @@ import nltk
 from nltk.tokenize import sent_tokenize
 from chunkers import chunk_sentence_pack
 from dataclass import Chunk
-from utils import estimate_tokens, normalize_text
+from utils import normalize_text, tag_chunk
 
 # ----------------------------
 # Web knowledge lookup (from website_knowledge.csv)
@@ -80,59 +82,6 @@ def _get_web_categories(url: str) -> List[str]:
     return []
 
 
-OPIOID_TOPICS: Dict[str, List[str]] = {
-    "overdose": [
-        "overdose", "unresponsive", "unconscious", "blue lips", "cyanosis",
-        "stopped breathing", "not breathing", "limp", "won't wake",
-    ],
-    "emergency": [
-        "call 911", "emergency", "immediate action", "acute", "life-threatening",
-        "emergency room", "er visit", "urgent care",
-    ],
-    "naloxone": [
-        "naloxone", "narcan", "intranasal", "nasal spray", "intramuscular",
-        "opioid reversal", "antagonist",
-    ],
-    "withdrawal": [
-        "withdrawal", "detox", "detoxification", "cravings", "taper", "tapering",
-        "physical dependence", "abstinence", "discontinuation",
-    ],
-    "dosage": [
-        "dosage", "dose", "mg", "milligram", "prescribe", "titrate", "titration",
-        "twice daily", "once daily", "frequency",
-    ],
-    "treatment": [
-        "buprenorphine", "methadone", "suboxone", "mat", "medication assisted",
-        "treatment program", "opioid use disorder", "oud", "subutex",
-    ],
-    "prevention": [
-        "harm reduction", "prevention", "safe use", "risk reduction",
-        "safe storage", "disposal", "lock box", "take back",
-    ],
-    "mental_health": [
-        "mental health", "depression", "anxiety", "ptsd", "co-occurring",
-        "dual diagnosis", "counseling", "therapy", "psychiatric",
-    ],
-    "legal": [
-        "law", "legal", "regulation", "prescription", "controlled substance",
-        "dea", "schedule", "patient rights", "privacy", "hipaa",
-    ],
-    "patient_education": [
-        "patient education", "inform patient", "tell patient", "family",
-        "caregiver", "warning signs", "side effects", "what to expect",
-    ],
-}
-
-
-def tag_chunk(text: str) -> Dict[str, Any]:
-    """Multi-label opioid topic tagging. Unmatched chunks get topics=[]."""
-    text_lower = text.lower()
-    matched = [
-        topic for topic, keywords in OPIOID_TOPICS.items()
-        if any(kw in text_lower for kw in keywords)
-    ]
-    return {"topics": matched, "is_tagged": len(matched) > 0}
-
 # Main processing pipeline
 def load_web_pages(json_dir: str) -> List[Dict[str, Any]]:
     """
@@ -211,7 +160,14 @@ def chunk_page(
         return []
 
     chunks: List[Chunk] = chunk_sentence_pack(text, doc_id, target_tokens)
-    chunks = [c for c in chunks if estimate_tokens(c.text) >= 30]
+    chunks = [c for c in chunks if c.token_count >= 30]
+
+    # Page-level fields are the same for every chunk; the category fallback
+    # scans the whole CSV map, so resolve them once per page.
+    source = page.get("source", "website")
+    url = page.get("url", "")
+    title = page.get("title", "")
+    categories = page.get("categories") or _get_web_categories(url)
 
     records: List[Dict[str, Any]] = []
     for chunk in chunks:
@@ -219,12 +175,12 @@ def chunk_page(
         records.append({
             "chunk_id":   chunk.chunk_id,
             "doc_id":     doc_id,
-            "source":     page.get("source", "website"),
-            "url":        page.get("url", ""),
-            "title":      page.get("title", ""),
-            "categories": page.get("categories") or _get_web_categories(page.get("url", "")),
+            "source":     source,
+            "url":        url,
+            "title":      title,
+            "categories": categories,
             "text":       chunk.text,
-            "token_count": estimate_tokens(chunk.text),
+            "token_count": chunk.token_count,
             "topics":     tags["topics"],
             "is_tagged":  tags["is_tagged"],
         })
@@ -254,7 +210,27 @@ def save_chunks(
     )
 
 
-def run(json_dir: str, out_dir: str, target_tokens: int = 7000, txt_dir: str = None) -> None:
+def _chunk_pages(pages: List[Dict[str, Any]], target_tokens: int, workers: int = None):
+    """Yield chunk_page() results in page order, on a process pool when workers > 1."""
+    workers = workers or os.cpu_count() or 1
+    chunk_one = partial(chunk_page, target_tokens=target_tokens)
+    if workers <= 1 or len(pages) <= 1:
+        yield from map(chunk_one, pages)
+        return
+    # Sentence splitting and tagging are pure-Python CPU work, so spread pages
+    # over processes; map() still yields results in input order.
+    workers = min(workers, len(pages))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(chunk_one, pages, chunksize=max(1, len(pages) // (workers * 4)))
+
+
+def run(
+    json_dir: str,
+    out_dir: str,
+    target_tokens: int = 7000,
+    txt_dir: str = None,
+    workers: int = None,
+) -> None:
     if txt_dir:
         pages = load_web_pages_txt(txt_dir)
         print(f"Loaded {len(pages)} web pages from '{txt_dir}' (txt mode)")
@@ -263,10 +239,9 @@ def run(json_dir: str, out_dir: str, target_tokens: int = 7000, txt_dir: str = N
         print(f"Loaded {len(pages)} web pages from '{json_dir}'")
 
     total_chunks = 0
-    for page in pages:
+    for page, chunk_records in zip(pages, _chunk_pages(pages, target_tokens, workers)):
         doc_id = page["_filename"]
         print(f"\n  Processing: {doc_id}")
-        chunk_records = chunk_page(page, target_tokens)
         if not chunk_records:
             print(f"    Skipped — no text content.")
             continue
@@ -300,6 +275,12 @@ def main() -> None:
         default=7000,
         help="Target chunk size in tokens (default: 7000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to chunk pages (default: CPU count; 1 disables the pool)",
+    )
     args = parser.parse_args()
 
     try:
@@ -312,6 +293,7 @@ def main() -> None:
         out_dir=args.out_dir,
         target_tokens=args.target_tokens,
         txt_dir=args.txt_dir,
+        workers=args.workers,
     )
 
 
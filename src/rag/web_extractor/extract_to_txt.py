@@ -62,24 +62,26 @@ def main():
 
     passed, failed, skipped = [], [], []
 
-    with WebExtractor() as extractor:
-        for url in urls:
-            filename = _url_to_filename(url)
-            out_path = output_dir / filename
+    pending = []
+    for url in urls:
+        filename = _url_to_filename(url)
+        if args.skip_existing and (output_dir / filename).exists():
+            logger.info("Skipping (exists): %s", filename)
+            skipped.append(url)
+            continue
+        pending.append(url)
 
-            if args.skip_existing and out_path.exists():
-                logger.info("Skipping (exists): %s", filename)
-                skipped.append(url)
+    with WebExtractor() as extractor:
+        for url, page in extractor.extract_many(pending):
+            if isinstance(page, WebExtractorError):
+                logger.error("Failed %s: %s", url, page)
+                failed.append((url, str(page)))
                 continue
 
-            try:
-                page = extractor.extract_from_url(url)
-                out_path.write_text(page.text, encoding="utf-8")
-                logger.info("Saved: %s (%d chars)", filename, len(page.text))
-                passed.append(url)
-            except WebExtractorError as exc:
-                logger.error("Failed %s: %s", url, exc)
-                failed.append((url, str(exc)))
+            filename = _url_to_filename(url)
+            (output_dir / filename).write_text(page.text, encoding="utf-8")
+            logger.info("Saved: %s (%d chars)", filename, len(page.text))
+            passed.append(url)
 
     logger.info(
         "\n── Summary ──────────────────────────────\n"
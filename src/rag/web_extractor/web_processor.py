@@ -8,10 +8,15 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 import requests
 import trafilatura
@@ -34,6 +39,8 @@ logger = logging.getLogger(__name__)
 _DEFAULT_TIMEOUT: Tuple[int, int] = (10, 30)   # (connect_sec, read_sec)
 _DEFAULT_RETRIES: int = 3
 _DEFAULT_BACKOFF: float = 0.5                   # wait = backoff * 2^(attempt-1)
+_DEFAULT_WORKERS: int = 8                       # concurrent fetches / pooled connections
+_DEFAULT_DOMAIN_DELAY: float = 0.2              # min seconds between hits to one host
 _MAX_CONTENT_BYTES: int = 10 * 1024 * 1024      # 10 MB hard cap
 _RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
 _ACCEPTED_CONTENT_TYPES = ("text/html", "text/plain", "application/xhtml+xml")
@@ -84,7 +91,7 @@ class ParseError(WebExtractorError):
 
 # Data model
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractedPage:
     """
     Immutable, typed result of a successful web extraction.
@@ -115,13 +122,60 @@ def _normalize_text(text: str) -> str:
     return text.strip()
 
 
-def _build_session(retries: int, backoff_factor: float) -> requests.Session:
+class _DomainRateLimiter:
+    """
+    Space requests to the same host at least ``min_interval`` seconds apart.
+
+    Each caller reserves the next free slot for its host under a lock and then
+    sleeps outside it.  The sleep occupies a pool worker, so a run of same-host
+    URLs longer than the pool would stall other hosts; :meth:`WebExtractor.extract_many`
+    avoids that by interleaving URLs across hosts with :func:`_interleave_by_host`.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self._min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if self._min_interval <= 0:
+            return
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _interleave_by_host(urls: List[str]) -> List[str]:
+    """Round-robin *urls* across hosts, keeping each host's URLs in input order."""
+    by_host: Dict[str, deque] = {}
+    for url in urls:
+        by_host.setdefault(urlsplit(url).netloc.lower(), deque()).append(url)
+    queues = deque(by_host.values())
+    ordered: List[str] = []
+    while queues:
+        queue = queues.popleft()
+        ordered.append(queue.popleft())
+        if queue:
+            queues.append(queue)
+    return ordered
+
+
+def _build_session(
+    retries: int, backoff_factor: float, pool_size: int = _DEFAULT_WORKERS
+) -> requests.Session:
     """
     Return a ``requests.Session`` pre-configured with retry logic.
 
     Retries are attempted only for idempotent GET/HEAD requests and only
     for HTTP status codes in ``_RETRYABLE_STATUS`` (e.g. 429, 5xx).
     Client errors (4xx, except 429) are **not** retried.
+
+    The connection pool holds ``pool_size`` connections per host so that
+    concurrent fetches reuse keep-alive connections instead of opening new ones.
     """
     session = requests.Session()
     retry_policy = Retry(
@@ -132,13 +186,37 @@ def _build_session(retries: int, backoff_factor: float) -> requests.Session:
         raise_on_status=False,  
         respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retry_policy)
+    adapter = HTTPAdapter(
+        max_retries=retry_policy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     session.headers.update({"User-Agent": _USER_AGENT})
     return session
 
 
+def _too_large_reason(size: Any) -> str:
+    return (
+        f"Response too large: {size} bytes "
+        f"(limit {_MAX_CONTENT_BYTES // (1024 * 1024)} MB)"
+    )
+
+
+def _read_capped(response: requests.Response, url: str) -> bytes:
+    """Read a streamed response body, aborting once it exceeds ``_MAX_CONTENT_BYTES``."""
+    buf = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buf += chunk
+            if len(buf) > _MAX_CONTENT_BYTES:
+                raise FetchError(url, _too_large_reason(f"over {_MAX_CONTENT_BYTES}"))
+    except requests.RequestException as exc:
+        raise FetchError(url, f"Error reading response body: {exc}")
+    return bytes(buf)
+
+
 # WebExtractor
 
 class WebExtractor:
@@ -158,6 +236,9 @@ class WebExtractor:
         retries:        Maximum retry attempts for transient HTTP errors.
         backoff_factor: Multiplier for exponential back-off between retries.
                         Actual wait = ``backoff_factor * 2 ** (attempt - 1)`` s.
+        max_workers:    Concurrent fetches used by :meth:`extract_many`.
+        per_domain_delay: Minimum seconds between :meth:`extract_many` requests
+                        to the same host; ``0`` disables the limit.
     """
 
     def __init__(
@@ -165,9 +246,13 @@ class WebExtractor:
         timeout: Tuple[int, int] = _DEFAULT_TIMEOUT,
         retries: int = _DEFAULT_RETRIES,
         backoff_factor: float = _DEFAULT_BACKOFF,
+        max_workers: int = _DEFAULT_WORKERS,
+        per_domain_delay: float = _DEFAULT_DOMAIN_DELAY,
     ) -> None:
         self._timeout = timeout
-        self._session = _build_session(retries, backoff_factor)
+        self._max_workers = max(1, max_workers)
+        self._session = _build_session(retries, backoff_factor, self._max_workers)
+        self._rate_limiter = _DomainRateLimiter(per_domain_delay)
 
     def close(self) -> None:
         """Release the underlying HTTP session and connection pool."""
@@ -186,8 +271,10 @@ class WebExtractor:
         Perform an HTTP GET and return the response body as a string.
 
         Validates HTTP status, Content-Type, and response size before
-        returning.  Transient errors (429, 5xx) are retried automatically
-        by the underlying session adapter.
+        returning.  The body is streamed and abandoned as soon as it passes
+        ``_MAX_CONTENT_BYTES``, so the cap also holds for responses without
+        a Content-Length header.  Transient errors (429, 5xx) are retried
+        automatically by the underlying session adapter.
 
         Args:
             url: Fully-qualified ``http://`` or ``https://`` URL.
@@ -198,7 +285,7 @@ class WebExtractor:
         """
         logger.debug("Fetching %s", url)
         try:
-            response = self._session.get(url, timeout=self._timeout)
+            response = self._session.get(url, timeout=self._timeout, stream=True)
         except requests.Timeout:
             raise FetchError(url, f"Timed out after {self._timeout}s")
         except requests.ConnectionError as exc:
@@ -206,31 +293,33 @@ class WebExtractor:
         except requests.RequestException as exc:
             raise FetchError(url, f"Request error: {exc}")
 
-        if not response.ok:
-            raise FetchError(
-                url,
-                response.reason or "Non-2xx response",
-                status_code=response.status_code,
-            )
+        with response:
+            if not response.ok:
+                raise FetchError(
+                    url,
+                    response.reason or "Non-2xx response",
+                    status_code=response.status_code,
+                )
 
-        content_type = response.headers.get("Content-Type", "")
-        if not any(ct in content_type for ct in _ACCEPTED_CONTENT_TYPES):
-            raise FetchError(
-                url,
-                f"Unsupported Content-Type '{content_type}'",
-                status_code=response.status_code,
-            )
+            content_type = response.headers.get("Content-Type", "")
+            if not any(ct in content_type for ct in _ACCEPTED_CONTENT_TYPES):
+                raise FetchError(
+                    url,
+                    f"Unsupported Content-Type '{content_type}'",
+                    status_code=response.status_code,
+                )
 
-        content_length = response.headers.get("Content-Length")
-        if content_length and int(content_length) > _MAX_CONTENT_BYTES:
-            raise FetchError(
-                url,
-                f"Response too large: {content_length} bytes "
-                f"(limit {_MAX_CONTENT_BYTES // (1024 * 1024)} MB)",
-            )
+            content_length = response.headers.get("Content-Length")
+            if content_length and int(content_length) > _MAX_CONTENT_BYTES:
+                raise FetchError(url, _too_large_reason(content_length))
 
-        logger.info("Fetched %s — %d bytes, status %d", url, len(response.content), response.status_code)
-        return response.text
+            body = _read_capped(response, url)
+
+        logger.info("Fetched %s — %d bytes, status %d", url, len(body), response.status_code)
+        try:
+            return body.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
 
     # Stage 2: HTML → XML
 
@@ -274,7 +363,8 @@ class WebExtractor:
                 {"type": "table",     "text": str}
         """
         try:
-            root = ET.fromstring(xml_str.encode("utf-8"))
+            # ElementTree parses str directly; encoding to UTF-8 first only copies it.
+            root = ET.fromstring(xml_str)
         except ET.ParseError as exc:
             raise ParseError(str(exc)) from exc
 
@@ -382,6 +472,50 @@ class WebExtractor:
         html = self.fetch_html(url)
         return self.extract(html, url=url)
 
+    def _fetch_throttled(self, url: str) -> str:
+        self._rate_limiter.wait(url)
+        return self.fetch_html(url)
+
+    def extract_many(
+        self, urls: List[str]
+    ) -> Iterator[Tuple[str, Union[ExtractedPage, WebExtractorError]]]:
+        """
+        Fetch *urls* concurrently and extract each page as its HTML arrives.
+
+        Downloads overlap on a thread pool sharing this extractor's session,
+        with requests to any one host spaced ``per_domain_delay`` apart.
+        URLs are scheduled round-robin across hosts, so a long run of one
+        site cannot tie up every worker; extraction runs in the calling
+        thread, in that scheduled order (not input order).  At most
+        ``2 * max_workers`` fetches are outstanding at once, so downloaded
+        HTML cannot pile up while extraction falls behind.
+
+        Args:
+            urls: URLs to fetch and extract.
+
+        Yields:
+            ``(url, page)`` on success, or ``(url, error)`` with the
+            :class:`WebExtractorError` raised for that URL.
+        """
+        url_iter = iter(_interleave_by_host(urls))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            in_flight: deque = deque()
+
+            def submit_next() -> None:
+                url = next(url_iter, None)
+                if url is not None:
+                    in_flight.append((url, pool.submit(self._fetch_throttled, url)))
+
+            for _ in range(2 * self._max_workers):
+                submit_next()
+            while in_flight:
+                url, future = in_flight.popleft()
+                submit_next()
+                try:
+                    yield url, self.extract(future.result(), url=url)
+                except WebExtractorError as exc:
+                    yield url, exc
+
 
 if __name__ == "__main__":
     import json
@@ -403,38 +537,39 @@ if __name__ == "__main__":
     passed: List[str] = []
     failed: List[tuple] = []
 
+    categories_by_url = {record["url"]: record["categories"] for record in records}
+
     with WebExtractor() as extractor:
-        for record in records:
-            url = record["url"]
-            categories = record["categories"]
-            try:
-                page = extractor.extract_from_url(url)
-                safe_name = re.sub(r"[^a-zA-Z0-9_-]", "_", url.split("//")[-1])[:80]
-                output_file = output_dir / f"{safe_name}.json"
-                payload = {
-                    "url":        page.url,
-                    "title":      page.title,
-                    "sitename":   page.sitename,
-                    "date":       page.date,
-                    "categories": categories,
-                    "source":     "website",
-                    "text":       page.text,
-                }
-                output_file.write_text(
-                    json.dumps(payload, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
-                logger.info(
-                    "Saved '%s' → %s [%s] (%d elements)",
-                    page.title or url,
-                    output_file,
-                    ", ".join(categories),
-                    page.element_count,
-                )
-                passed.append(url)
-            except WebExtractorError as exc:
-                logger.error("Skipping %s: %s", url, exc)
-                failed.append((url, str(exc)))
+        for url, page in extractor.extract_many(list(categories_by_url)):
+            if isinstance(page, WebExtractorError):
+                logger.error("Skipping %s: %s", url, page)
+                failed.append((url, str(page)))
+                continue
+
+            categories = categories_by_url[url]
+            safe_name = re.sub(r"[^a-zA-Z0-9_-]", "_", url.split("//")[-1])[:80]
+            output_file = output_dir / f"{safe_name}.json"
+            payload = {
+                "url":        page.url,
+                "title":      page.title,
+                "sitename":   page.sitename,
+                "date":       page.date,
+                "categories": categories,
+                "source":     "website",
+                "text":       page.text,
+            }
+            output_file.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            logger.info(
+                "Saved '%s' → %s [%s] (%d elements)",
+                page.title or url,
+                output_file,
+                ", ".join(categories),
+                page.element_count,
+            )
+            passed.append(url)
 
     logger.info(
         "\n── Summary ──────────────────────────────\n"